@@ -1,7 +1,20 @@
 import pytest
 
-from typecrate.exceptions import ValueDoesNotExist
-from typecrate.expression import ExpressionNode, E
+from typecrate.exceptions import InvalidSourceExpression, ValueDoesNotExist
+from typecrate.expression import Expression, ExpressionNode, E, evaluate_many
+
+
+@pytest.fixture(params=["expression", "node"])
+def compile_expr(request):
+    """
+    Compiles an expression under both getter APIs: the flat `Expression`
+    walker and the `ExpressionNode` chain share the same get() semantics
+    for plain lookups, so those tests run once per API instead of being
+    duplicated per module.
+    """
+    if request.param == "expression":
+        return Expression
+    return ExpressionNode.build
 
 
 def test_build_simple_expression():
@@ -25,6 +38,12 @@ def test_build_empty_expression():
     assert root is None
 
 
+# Test the build method with misordered brackets
+def test_build_misordered_brackets():
+    with pytest.raises(InvalidSourceExpression):
+        ExpressionNode.build("a]b[")
+
+
 # Test the build method with optional chaining
 def test_build_with_optional():
     root = ExpressionNode.build("a.b?")
@@ -78,8 +97,8 @@ def test_build_complex_array_expression():
 
 
 # Test getting value from a dictionary
-def test_get_from_dict():
-    root = ExpressionNode.build("a.b.c")
+def test_get_from_dict(compile_expr):
+    root = compile_expr("a.b.c")
     test_dict = {'a': {'b': {'c': 42}}}
     assert root.get(test_dict) == 42
 
@@ -110,60 +129,60 @@ def test_get_with_default():
 
 
 # Test getting value with an array index
-def test_get_with_array_index():
-    root = ExpressionNode.build("a[0].b[1]")
+def test_get_with_array_index(compile_expr):
+    root = compile_expr("a[0].b[1]")
     test_dict = {'a': [{'b': [0, 42]}]}
     assert root.get(test_dict) == 42
 
 
 # Test getting value with multiple array indices
-def test_get_with_multiple_array_indices():
-    root = ExpressionNode.build("a[0][1]")
+def test_get_with_multiple_array_indices(compile_expr):
+    root = compile_expr("a[0][1]")
     test_dict = {'a': [[0, 42]]}
     assert root.get(test_dict) == 42
 
 
 # Test getting value from an invalid source
-def test_get_invalid_source():
-    root = ExpressionNode.build("a.b.c")
+def test_get_invalid_source(compile_expr):
+    root = compile_expr("a.b.c")
     test_dict = {"a": {"b": 1}}
     with pytest.raises(ValueDoesNotExist):
         root.get(test_dict)
 
 
 # Test getting value from an invalid source
-def test_get_data_from_array():
-    root = ExpressionNode.build("a.b.c")
+def test_get_data_from_array(compile_expr):
+    root = compile_expr("a.b.c")
     test_dict = {"a": {"b": {"c": [1, 2, 3, 4]}}}
     assert root.get(test_dict) == [1, 2, 3, 4]
 
 
-def test_get_data_from_array_index():
-    root = ExpressionNode.build("a.b.c[0]")
+def test_get_data_from_array_index(compile_expr):
+    root = compile_expr("a.b.c[0]")
     test_dict = {"a": {"b": {"c": [1, 2, 3, 4]}}}
     assert root.get(test_dict) == 1
 
 
-def test_get_data_from_array_slice():
-    root = ExpressionNode.build("a.b.c[0:2:1]")
+def test_get_data_from_array_slice(compile_expr):
+    root = compile_expr("a.b.c[0:2:1]")
     test_dict = {"a": {"b": {"c": [1, 2, 3, 4]}}}
     assert root.get(test_dict) == [1, 2]
 
 
-def test_get_data_from_array_slice_with_2_step():
-    root = ExpressionNode.build("a.b.c[0:5:2]")
+def test_get_data_from_array_slice_with_2_step(compile_expr):
+    root = compile_expr("a.b.c[0:5:2]")
     test_dict = {"a": {"b": {"c": [1, 2, 3, 4]}}}
     assert root.get(test_dict) == [1, 3]
 
 
-def test_get_data_from_array_slice_with_just_step():
-    root = ExpressionNode.build("a.b.c[::2]")
+def test_get_data_from_array_slice_with_just_step(compile_expr):
+    root = compile_expr("a.b.c[::2]")
     test_dict = {"a": {"b": {"c": [1, 2, 3, 4]}}}
     assert root.get(test_dict) == [1, 3]
 
 
-def test_get_data_from_array_slice_with_start_end():
-    root = ExpressionNode.build("a.b.c[0:3]")
+def test_get_data_from_array_slice_with_start_end(compile_expr):
+    root = compile_expr("a.b.c[0:3]")
     test_dict = {"a": {"b": {"c": [1, 2, 3, 4]}}}
     assert root.get(test_dict) == [1, 2, 3]
 
@@ -174,6 +193,24 @@ def test_get_data_from_array_index_optional():
     assert root.get(test_dict) is None
 
 
+def test_evaluate_many_shared_prefix():
+    roots = [
+        ExpressionNode.build("person.name"),
+        ExpressionNode.build("person.age"),
+        ExpressionNode.build("city"),
+    ]
+    data = {"person": {"name": "Alice", "age": 30}, "city": "Dhaka"}
+    assert evaluate_many(roots, data) == ["Alice", 30, "Dhaka"]
+
+
+def test_evaluate_many_missing_prefix():
+    roots = [
+        ExpressionNode.build("person.name?"),
+        ExpressionNode.build("person.age", default="N/A"),
+    ]
+    assert evaluate_many(roots, {"person": {}}) == [None, "N/A"]
+
+
 def test_simple_key_fetching():
     e = E("name.first")
     assert e.get({"name": {"first": "John", "last": "Doe"}}) == "John"
@@ -216,6 +253,12 @@ def test_using_array_wildcards():
     assert e.get({"a": [{"b": 1}, {"b": 2}, {"b": 3}]}) == [1, 2, 3]
 
 
+def test_array_wildcard_mixed_shapes(compile_expr):
+    root = compile_expr("a[*].b")
+    assert root.get({"a": [{"b": [1, 2]}, {"b": 3}]}) == [1, 2, 3]
+    assert root.get({"a": [{"b": 3}, {"b": [1, 2]}]}) == [3, 1, 2]
+
+
 def test_unique_operator():
     e = E("a.b[*]^")
     assert e.get({"a": {"b": [1, 1, 2, 3, 3]}}) == [1, 2, 3]
@@ -9,8 +9,18 @@ class BuiltinFunctionsError(Exception):
 class ValueDoesNotExist(Exception):
     """
     If given source is not found in the source, raise this exception
+
+    Can be raised as ``ValueDoesNotExist(template, *values)``: the
+    message is then only built when the exception is rendered. Optional
+    chains raise and swallow this exception as their normal control
+    flow, so the swallowed path never pays for `str.format`.
     """
 
+    def __str__(self):
+        if len(self.args) > 1:
+            return self.args[0].format(*self.args[1:])
+        return super().__str__()
+
 
 class InvalidDataType(Exception):
     """
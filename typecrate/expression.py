@@ -1,13 +1,19 @@
-from enum import Enum
-from typing import Any, List, Union
+import re
+import sys
+from array import array
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from typing import Any, List, Mapping, Union
 
-from typecrate.datatype import Empty
+from typecrate.datatype import Empty, NonExistent
 from typecrate.exceptions import (
+    InvalidDataType,
     InvalidSourceExpression,
     ValueDoesNotExist,
 )
-from typecrate.methods import classproperty
-from typecrate.utils import get_attribute, is_iterable
+from typecrate.structure import EArray
+from typecrate.utils import get_attribute, is_callable, is_iterable
 
 
 class Token:
@@ -23,20 +29,30 @@ class Token:
     ASTER = "*"
     COLON = ":"
 
-    @classproperty
-    def seperator_tokens(self):
-        return {self.LSB, self.RSB, self.DOT}
+    # Materialized once as plain class attributes; the previous
+    # `classproperty` accessors paid a descriptor `__get__` call on
+    # every access.
+    seperator_tokens = frozenset({LSB, RSB, DOT})
+    # Unary operators, work on the current node.
+    unr_operators = frozenset({Q_MARK, UP_CARET})
+    operators = frozenset({PLUS, PIPE})
 
-    @classproperty
-    def unr_operators(self):
-        """
-        Unary operator, works on the current node
-        """
-        return {self.Q_MARK, self.UP_CARET}
 
-    @classproperty
-    def operators(self):
-        return {self.PLUS, self.PIPE}
+# Module-level aliases used by the hot parse paths; one LOAD_GLOBAL
+# instead of a class attribute lookup.
+_SEPARATOR_TOKENS = Token.seperator_tokens
+_UNARY_OPERATORS = Token.unr_operators
+_OPERATORS = Token.operators
+_SEP_OR_UNARY = _SEPARATOR_TOKENS | _UNARY_OPERATORS
+
+# Characters whose presence requires the full parse state machine. Plain
+# dotted lookups ("a.b.c") - the dominant real-world shape - avoid it.
+_SPECIAL_CHARS = frozenset("[]?^|+*:")
+
+# Sentinel for dict lookups: missing keys on optional chains are the
+# expected path, not the exceptional one, so they must not pay for a
+# raised-and-swallowed exception.
+_MISSING = object()
 
 
 def to_int(string: str) -> Union[int, None]:
@@ -45,30 +61,42 @@ def to_int(string: str) -> Union[int, None]:
     return int(string)
 
 
+# Classifies a segment in a single C-level scan: an identifier/wildcard,
+# an integer index or a slice spec, with the surrounding brackets swallowed
+# by the pattern itself. Replaces the chain of strip/removeprefix/isalpha/
+# isdigit/split passes over the same short string.
+_ATTR_RE = re.compile(
+    r"^\[?(?:(?P<name>[A-Za-z_*]+)|(?P<num>\d+)|(?P<slice>-?\d*(?::-?\d*){1,2}))\]?$"
+)
+
+
 def extract_attribute(expression: str) -> Union[str, int, List]:
-    attr = (
-        expression.strip()
-        .removesuffix(Token.RSB)
-        .removeprefix(Token.LSB)
-    )
-    if attr.isalpha() or attr == Token.ASTER:
-        return attr
-    if attr.isdigit():
-        return int(attr)
+    attr = expression.strip()
+    match = _ATTR_RE.match(attr)
+    if match is not None:
+        name = match.group("name")
+        if name is not None:
+            return name
+        num = match.group("num")
+        if num is not None:
+            return int(num)
+        colon_attr = [to_int(part) for part in match.group("slice").split(Token.COLON)]
+        if len(colon_attr) == 2:
+            colon_attr.append(1)
+        return colon_attr
     if Token.COLON in attr:
+        # Malformed slice: keep the strict error reporting of the old path.
         try:
-            colon_attr = list(map(to_int, attr.split(Token.COLON)))
+            list(map(to_int, attr.split(Token.COLON)))
         except ValueError:
             raise InvalidSourceExpression(
                 "Syntax error, slice operators must be integer"
             )
-        if len(colon_attr) > 3:
-            raise InvalidSourceExpression(
-                "Syntax error, Slice operation must follow `[start:end:step]`"
-            )
-        if len(colon_attr) == 2:
-            colon_attr.append(1)
-        return colon_attr
+        raise InvalidSourceExpression(
+            "Syntax error, Slice operation must follow `[start:end:step]`"
+        )
+    # The parser hands over bracket-free segment slices, so no prefix or
+    # suffix stripping (and its per-segment allocations) is needed here.
     return attr
 
 
@@ -81,6 +109,10 @@ def format_attribute(attr: str):
 
 
 class BaseGetter:
+    # Empty slots so slotted subclasses don't regrow a per-instance
+    # `__dict__` through the base class.
+    __slots__ = ()
+
     def get(self, obj: Any):
         """Placeholder method to get the value from an object based on some expression."""
         pass
@@ -90,11 +122,25 @@ class BaseGetter:
         pass
 
 
-class OperationType(Enum):
-    OBJ = "OBJECT"
-    ARR = "ARRAY"
-    ARR_SELECT = "ARRAY_SELECT"
-    ARR_SLICE = "ARRAY_SLICE"
+class OperationType:
+    """
+    Small-int operation codes. Integer equality is a single C compare,
+    whereas Enum `__eq__` dispatches through Python on every step of
+    `get`, so the codes are plain ints rather than Enum members.
+    """
+
+    OBJ = 0
+    ARR = 1
+    ARR_SELECT = 2
+    ARR_SLICE = 3
+
+
+# Module-level aliases so the hot loop reads the codes with one LOAD_GLOBAL
+# instead of an attribute lookup per compare.
+OP_OBJ = OperationType.OBJ
+OP_ARR = OperationType.ARR
+OP_ARR_SELECT = OperationType.ARR_SELECT
+OP_ARR_SLICE = OperationType.ARR_SLICE
 
 
 def get_operation_type(attr: Union[str, List, int], in_bracket: bool) -> OperationType:
@@ -107,6 +153,82 @@ def get_operation_type(attr: Union[str, List, int], in_bracket: bool) -> Operati
     return OperationType.OBJ
 
 
+@lru_cache(maxsize=4096)
+def parse_expression(expression: str) -> tuple:
+    """
+    Parses an expression string into a tuple of `(operation, attribute)` pairs.
+
+    The parse is O(len(expression)) char-by-char work, and the same
+    expression strings tend to be reused across `Expression` instances,
+    so the result is memoized at module level. The returned tuple is
+    treated as immutable and shared between instances.
+    """
+    start, index, br_margin = 0, 0, 0
+    in_brackets = False
+    exp_len = len(expression)
+    attr_list = []
+    while index < exp_len:
+        char = expression[index]
+        if char in _SEP_OR_UNARY or index == exp_len - 1:
+            # The final character belongs to the last segment unless it is
+            # itself a separator; this keeps bracket characters out of the
+            # segment text entirely (trailing `?`/`^` markers stay in, the
+            # optional flag is read off them later).
+            end = (
+                index + 1
+                if index == exp_len - 1 and char not in _SEPARATOR_TOKENS
+                else index
+            )
+            attribute = extract_attribute(expression[start:end])
+            operation = get_operation_type(attribute, in_brackets)
+            start = index + 1
+            # Empty segments (e.g. around separators) are skipped; a plain
+            # truthiness test would also drop the valid index `0` here.
+            if attribute != "":
+                attr_list.append(
+                    (operation, attribute)
+                )
+
+            if char == Token.LSB:
+                if in_brackets:
+                    raise InvalidSourceExpression(
+                        "{} Syntax error, "
+                        "`[` inside `[]` not allowed.".format(expression)
+                    )
+                # Mark that we are inside array brackets
+                in_brackets = True
+                # Increment the bracket margin counter
+                br_margin += 1
+
+            elif char == Token.RSB:
+                if not in_brackets:
+                    raise InvalidSourceExpression(
+                        "`{}` Syntax error in source expression, "
+                        "Array index must be in the following pattern "
+                        "`item[n]`".format(expression)
+                    )
+                in_brackets = False
+                # Decrement the bracket margin counter
+                br_margin -= 1
+
+            else:
+                if index < exp_len - 2:
+                    if expression[index + 1] == "[":
+                        raise InvalidSourceExpression(
+                            "`{}` Syntax error in source expression, "
+                            "Cannot contain array index after `.` operator"
+                            "".format(expression)
+                        )
+
+        index += 1
+
+    # If the bracket margin is still greater than zero, it means we have unmatched brackets
+    if br_margin > 0:
+        raise InvalidSourceExpression("{} Syntax error: Unmatched '['.".format(expression))
+
+    return tuple(attr_list)
+
+
 class BasicE(BaseGetter):
     """
     BasicE class also known as BasicExpression getter.
@@ -194,8 +316,38 @@ class Expression(BaseGetter):
     def __init__(self, expression: str, default=Empty):
         self.expression = expression
         self.default = default
-        self.expression_list = self.parse(self.expression)
+        self.expression_list = parse_expression(expression)
         self.exp_len = len(self.expression_list)
+        # Flat opcode stream walked by `get`, laid out struct-of-arrays
+        # style: the loop reads only the columns the current step needs,
+        # and the opcode column is a compact byte array. Nothing is
+        # recomputed per call.
+        self._opcodes = array("b", (operation for operation, _ in self.expression_list))
+        self._attrs = tuple(attr for _, attr in self.expression_list)
+        # Interned so the dict lookups inside `get_attribute` hit the
+        # pointer-equality fast path instead of a full string hash +
+        # compare per call.
+        self._fmt_attrs = tuple(
+            sys.intern(format_attribute(attr)) if type(attr) is str else attr
+            for attr in self._attrs
+        )
+        self._opt_flags = tuple(
+            attr.endswith(Token.Q_MARK) if type(attr) is str else False
+            for attr in self._attrs
+        )
+        # Prebuilt slice objects: Python slicing treats None bounds
+        # natively, so no per-call defaulting or len() is needed.
+        self._slices = tuple(
+            slice(*attr) if type(attr) is list else None for attr in self._attrs
+        )
+        # Specialized path for plain dotted lookups: no brackets, markers
+        # or operators means `get` can run a bare attribute-walk loop with
+        # no opcode dispatch at all.
+        self._fast = None
+        if expression and not (_SPECIAL_CHARS & set(expression)):
+            segments = tuple(expression.split(Token.DOT))
+            if all(segments):
+                self._fast = segments
 
     def get_default(self, default):
         return default if default is not Empty else self.default
@@ -212,69 +364,11 @@ class Expression(BaseGetter):
             raise exc
 
     def parse(self, expression):
-        start, index, br_margin = 0, 0, 0
-        in_brackets = False
-        exp_len = len(expression)
-        attr_list = []
-        while index < exp_len:
-            char = expression[index]
-            if (
-                    char in Token.seperator_tokens
-                    or char in Token.unr_operators
-                    or index == exp_len - 1
-            ):
-                # Determining end index, as for the last index, the last character stays missing
-                end = index + 1 if index == exp_len - 1 else index
-                attribute = extract_attribute(expression[start:end])
-                operation = get_operation_type(attribute, in_brackets)
-                start = index + 1
-                if attribute:
-                    attr_list.append(
-                        (operation, attribute)
-                    )
-
-                if char == Token.LSB:
-                    if in_brackets:
-                        raise InvalidSourceExpression(
-                            "{} Syntax error, "
-                            "`[` inside `[]` not allowed.".format(expression)
-                        )
-                    # Mark that we are inside array brackets
-                    in_brackets = True
-                    # Increment the bracket margin counter
-                    br_margin += 1
-
-                elif char == Token.RSB:
-                    if not in_brackets:
-                        raise InvalidSourceExpression(
-                            "`{}` Syntax error in source expression, "
-                            "Array index must be in the following pattern "
-                            "`item[n]`".format(expression)
-                        )
-                    in_brackets = False
-                    # Decrement the bracket margin counter
-                    br_margin -= 1
-
-                else:
-                    if index < exp_len - 2:
-                        if expression[index + 1] == "[":
-                            raise InvalidSourceExpression(
-                                "`{}` Syntax error in source expression, "
-                                "Cannot contain array index after `.` operator"
-                                "".format(expression)
-                            )
-
-            index += 1
-
-        # If the bracket margin is still greater than zero, it means we have unmatched brackets
-        if br_margin > 0:
-            raise InvalidSourceExpression("{} Syntax error: Unmatched '['.".format(expression))
-
-        return attr_list
+        return parse_expression(expression)
 
     def handle_obj_attr(self, instance, attr, default, index, raw):
         instance = self.get_attribute(instance, attr, default)
-        instance = self.get(instance, default, index + 1, raw)
+        instance = self._walk(instance, index + 1, self.get_default(default), raw)
         return instance
 
     def handle_array_attr(
@@ -286,8 +380,7 @@ class Expression(BaseGetter):
             index: int,
             root: Any
     ):
-        ret = []
-        if not is_iterable(instance):
+        if type(instance) is not list and not is_iterable(instance):
             raise ValueError(
                 "Value is not iterable for source `{}`".format(
                     self.expression
@@ -299,62 +392,857 @@ class Expression(BaseGetter):
             end = end or len(instance)
             step = step or 1
             instance = instance[start:end:step]
-        for each in instance:
-            val = self.get(each, default, index + 1, root)
-            if type(val) is not list:
-                ret.append(
-                    val
-                )
-            else:
-                ret += val
+        default_value = self.get_default(default)
+        parts = [self._walk(each, index + 1, default_value, root) for each in instance]
+        # Flatten in one pass: repeated `ret += val` reallocates the result
+        # buffer per list-valued element, which is quadratic in the worst
+        # case for wildcard fan-outs.
+        ret = list(
+            chain.from_iterable(
+                part if part.__class__ is list else (part,) for part in parts
+            )
+        )
         if operation == OperationType.ARR_SELECT:
             ret = ret[attr]
         return ret
 
-    def get(self, instance: Any, default=Empty, index=0, root=Empty):
-        expression_list = self.expression_list
-        exp_len = self.exp_len
+    def get(self, instance: Any, default=Empty):
+        # Defaults and the root reference are resolved exactly once here;
+        # `_walk` never re-tests the sentinels on its way down.
+        default_value = default if default is not Empty else self.default
 
-        root = instance if root is Empty else root
+        if self._fast is not None:
+            try:
+                for name in self._fast:
+                    if not instance:
+                        return instance
+                    if type(instance) is dict:
+                        value = instance.get(name, _MISSING)
+                        if value is not _MISSING and not callable(value):
+                            instance = value
+                            continue
+                    instance = get_attribute(instance, name)
+            except ValueDoesNotExist:
+                if default_value is not Empty:
+                    return default_value
+                raise
+            return instance
 
-        default_value = default if default is not Empty else self.default
+        return self._walk(instance, 0, default_value, instance)
+
+    def _walk(self, instance, index, default_value, root):
+        opcodes = self._opcodes
+        fmt_attrs = self._fmt_attrs
+        exp_len = self.exp_len
 
         while index < exp_len and instance:
-            operation, attr = expression_list[index]
+            op = opcodes[index]
+
+            if op == OP_OBJ:
+                fmt = fmt_attrs[index]
+                if type(instance) is dict:
+                    value = instance.get(fmt, _MISSING)
+                    if value is _MISSING:
+                        if self._opt_flags[index] or default_value is not Empty:
+                            return default_value
+                        raise ValueDoesNotExist(
+                            "Value doesn't exist for key `{}`", fmt
+                        )
+                    if not callable(value):
+                        instance = value
+                        index += 1
+                        continue
+                    # Callable dict values keep the generic path so the
+                    # auto-invocation semantics of get_attribute hold.
 
-            if operation == OperationType.OBJ:
                 try:
-                    instance = get_attribute(instance, format_attribute(attr))
+                    instance = get_attribute(instance, fmt)
                 except ValueDoesNotExist as exc:
-                    if attr.endswith("?") or default_value is not Empty:
+                    if self._opt_flags[index] or default_value is not Empty:
                         return default_value
                     raise exc
 
                 index += 1
 
+            elif op == OP_ARR_SELECT:
+                # `type is list` is a C-level pointer compare; only exotic
+                # containers pay for the full protocol inspection.
+                if type(instance) is not list and not is_iterable(instance):
+                    raise ValueError(
+                        "Value is not iterable for source `{}`".format(self.expression)
+                    )
+                instance = instance[self._attrs[index]]
+                index += 1
+
             else:
-                if not is_iterable(instance):
+                if type(instance) is not list and not is_iterable(instance):
                     raise ValueError(
                         "Value is not iterable for source `{}`".format(self.expression)
                     )
 
-                if operation == OperationType.ARR_SLICE:
-                    start, end, step = attr
-                    start = start or 0
-                    end = end or len(instance)
-                    step = step or 1
-                    instance = instance[start:end:step]
+                if op == OP_ARR_SLICE:
+                    instance = instance[self._slices[index]]
+
+                index += 1
+                if index >= exp_len:
+                    return list(instance)
+
+                # Fan-out is intrinsically per-element; only here do we pay
+                # for a Python frame per item, every scalar step above runs
+                # in the flat loop. Whether the tail yields a list depends
+                # on the element's data (a nested fan-out over `{"b": 3}`
+                # is a scalar, over `{"b": [1, 2]}` a list), so each result
+                # is shape-tested individually - a C-level pointer compare -
+                # and flattened or appended accordingly.
+                walk = self._walk
+                ret = []
+                ret_append = ret.append
+                for each in instance:
+                    val = walk(each, index, default_value, root)
+                    if type(val) is list:
+                        ret += val
+                    else:
+                        ret_append(val)
+                return ret
+
+        return instance
+
+
+class SourceOpType:
+    """
+    Operation type of a single source segment inside an expression.
+    `CHILD_OBJ_SELECT` reads a key/attribute, `ARRAY_INDEX_SELECT` reads a
+    single element, the remaining ones fan out over an iterable.
+
+    Small ints, like `OperationType`: comparing them is a single C
+    compare per step instead of a hashed string comparison.
+    """
+
+    CHILD_OBJ_SELECT = 0
+    ARRAY_INDEX_SELECT = 1
+    ARRAY_SLICE_SELECT = 2
+    ARRAY_MULTI_INDEX_SELECT = 3
+    ARRAY_FULL_SELECT = 4
+
+    # Operation types that fan out over every element of the instance.
+    # A plain class attribute; the descriptor round trip of the old
+    # `classproperty` alias bought nothing for a constant.
+    array_op_type = frozenset(
+        {
+            ARRAY_SLICE_SELECT,
+            ARRAY_MULTI_INDEX_SELECT,
+            ARRAY_FULL_SELECT,
+        }
+    )
+
+
+# Module-level alias used by `SourceNode.__init__`.
+_ARRAY_OP_TYPES = SourceOpType.array_op_type
+
+
+# Classifies a bracket-free array segment in one C-level match: an
+# integer index, a slice spec or a comma-separated multi-index.
+_SRC_RE = re.compile(
+    r"^(?:(?P<idx>[+-]?\d+)"
+    r"|(?P<slice>-?\d*:-?\d*(?::-?\d*)?)"
+    r"|(?P<multi>-?\d+(?:,-?\d+)+))$"
+)
+
+
+def _raise_array_segment_error(expression):
+    """
+    Classifies a malformed array segment and raises the matching
+    `InvalidSourceExpression`. Cold path, only reached when `_SRC_RE`
+    rejects the segment.
+    """
+    if Token.COLON in expression:
+        if "," in expression:
+            raise InvalidSourceExpression(
+                f"Invalid source `[{expression}]`, cannot mix "
+                f"slice and multi index selection"
+            )
+        if expression.count(Token.COLON) > 2:
+            raise InvalidSourceExpression(
+                f"Invalid source `[{expression}]`, Slice "
+                f"operation must follow `[start:end:step]`"
+            )
+        raise InvalidSourceExpression(
+            f"Invalid source `[{expression}]`, Slice "
+            f"operator must have integers"
+        )
+    if "," in expression:
+        raise InvalidSourceExpression(
+            f"Invalid source `[{expression}]`, Multi index "
+            f"selection must have integers"
+        )
+    raise InvalidSourceExpression(
+        f"Invalid source `[{expression}]`, Array index "
+        f"must be an integer"
+    )
+
+
+class SourceNode:
+    """
+    Parses a single raw segment of an expression (`name`, `[0]`, `[1:2]`,
+    `[1,2]`, `[*]`) into a `getter` plus a `source_op_type` describing how
+    the getter must be applied to an instance.
+
+    Attributes:
+        getter: The key/attribute name, integer index, slice parts or
+                index list extracted from the segment.
+        source_op_type (str): One of the `SourceOpType` values.
+        unique_array (bool): True if the segment carries the `^` marker,
+                             array results are then de-duplicated.
+    """
+
+    def __init__(self, expression: str):
+        self.raw = expression
+        # One pass extracts the flags and cleans the segment: strip,
+        # then peel trailing markers while recording `^` (so `a^?` and
+        # `a?^` both dedupe), then drop the brackets. The old split
+        # between an `endswith` probe here and a separate cleaning
+        # helper re-scanned the same short string three times.
+        expression = expression.strip()
+        if " " in expression:
+            expression = expression.replace(" ", "")
+        unique = False
+        tail = expression[-1:]
+        while tail == Token.UP_CARET or tail == Token.Q_MARK:
+            if tail == Token.UP_CARET:
+                unique = True
+            expression = expression[:-1]
+            tail = expression[-1:]
+        self.unique_array = unique
+        is_array = expression[:1] == Token.LSB
+        if is_array:
+            expression = expression[1:]
+            if expression[-1:] == Token.RSB:
+                expression = expression[:-1]
+        self.source_op_type = SourceOpType.CHILD_OBJ_SELECT
+        # Key segments repeat heavily across compiled expressions
+        # ("id", "name", ...); interning shares one copy per key and
+        # gives mapping lookups the pointer-equality fast path.
+        getter = expression if is_array else sys.intern(expression)
+
+        if is_array:
+            if expression == Token.ASTER:
+                self.source_op_type = SourceOpType.ARRAY_FULL_SELECT
+            else:
+                # One C-level match classifies the segment as an integer
+                # index, a slice or a multi-index and validates its
+                # digits, replacing the colon/comma substring scans and
+                # per-branch try/int probing.
+                match = _SRC_RE.match(expression)
+                kind = match.lastgroup if match is not None else None
+                if kind == "idx":
+                    self.source_op_type = SourceOpType.ARRAY_INDEX_SELECT
+                    getter = int(expression)
+                elif kind == "slice":
+                    self.source_op_type = SourceOpType.ARRAY_SLICE_SELECT
+                    # `partition` pulls the (already validated) parts out
+                    # without `split`'s intermediate list; an absent stop
+                    # or step falls through as the empty string.
+                    start, _, rest = expression.partition(Token.COLON)
+                    stop, _, step = rest.partition(Token.COLON)
+                    getter = [
+                        int(start) if start else None,
+                        int(stop) if stop else None,
+                        int(step) if step else None,
+                    ]
+                    # Built once: Python slicing handles None bounds
+                    # natively, so no per-call defaulting or len() is
+                    # needed (and negative steps behave correctly).
+                    self.static_slice = slice(*getter)
+                elif kind == "multi":
+                    self.source_op_type = SourceOpType.ARRAY_MULTI_INDEX_SELECT
+                    getter = [int(part) for part in expression.split(",")]
+                    # C-implemented picker specialized on the fixed
+                    # indices; the fan-out applies it instead of a
+                    # Python-level loop over `getter`.
+                    self.multi_getter = itemgetter(*getter)
+                else:
+                    _raise_array_segment_error(expression)
+        self.getter = getter
+        # Fan-out vs scalar is decided once here; the walk then reads a
+        # plain bool instead of probing set membership per step.
+        self.is_array_op = self.source_op_type in _ARRAY_OP_TYPES
+
+
+# Segment tokenizer for `ExpressionNode._build`: a bracketed selector, a
+# trailing `?`/`^` marker, or a bare name. One C-level scan replaces the
+# per-character Python dispatch loop.
+_NODE_TOKEN_RE = re.compile(
+    r"(?P<arr>\[[^\[\]]*\])|(?P<mark>[?^])|(?P<obj>[^.\[\]?^]+)"
+)
+
+def _compile_chain(nodes):
+    """
+    Emits a monolithic getter for chains of plain key/index segments.
+
+    `a.b[0].c` becomes a single compiled `instance['a']['b'][0]['c']`
+    expression, which CPython evaluates as a run of BINARY_SUBSCR
+    opcodes instead of one interpreted node-step per segment. Anything
+    the subscript form cannot express for the given instance - object
+    attributes, auto-invoked callables, missing keys with defaults -
+    raises out of the subscript and is redone by the interpreted walk
+    passed in as `fallback`. Chains with optional markers, slices, `*`
+    or multi-index segments are not compiled.
+    """
+    parts = []
+    for node in nodes:
+        source = node.source
+        if source is None or node.optional:
+            return None
+        op = source.source_op_type
+        if op != SourceOpType.CHILD_OBJ_SELECT and op != SourceOpType.ARRAY_INDEX_SELECT:
+            return None
+        parts.append("[{!r}]".format(source.getter))
+    src = (
+        "def compiled(instance, fallback):\n"
+        "    try:\n"
+        "        return instance{}\n"
+        "    except (TypeError, LookupError, AttributeError):\n"
+        "        return fallback(instance)\n"
+    ).format("".join(parts))
+    namespace = {}
+    exec(compile(src, "<typecrate.compiled>", "exec"), namespace)
+    return namespace["compiled"]
+
+
+# Compiled node chains keyed by `(class, expression, default)`. Bounded
+# like the `parse_expression` lru cache; a plain dict keeps the lookup a
+# single hash probe with no wrapper-call overhead.
+_BUILD_CACHE = {}
+_BUILD_CACHE_MAX = 4096
+
+# Hash-consing pool for chain tails: identical suffixes of different
+# expressions resolve to the same node object. Keys include the child's
+# identity, so a hit guarantees an identical remaining chain; entries
+# keep their nodes alive, which keeps `id(child)` keys stable.
+_NODE_POOL = {}
+_NODE_POOL_MAX = 8192
+
+# Memoized `isinstance(x, Mapping)` verdicts keyed by concrete type:
+# the ABC subclass check is orders of magnitude slower than a dict hit
+# and instance types repeat on every traversal step.
+_MAPPING_TYPE_CACHE = {}
+
+# Memoized `is_callable` verdicts keyed by `(type, attribute name)`:
+# whether an attribute is an auto-invocable method is stable per class,
+# and `is_callable` runs a full signature inspection per call.
+_CALL_CACHE = {}
+
+# Concrete types that are always iterable; everything else falls back to
+# the Iterable ABC check once per type.
+_ITER_TYPES = frozenset({list, tuple, set, frozenset, dict, str})
+_ITER_TYPE_CACHE = {}
+
+
+def _is_iterable_fast(instance):
+    """
+    `is_iterable` with the ABC machinery peeled off the hot path: a
+    frozenset probe answers for the common concrete types and other
+    verdicts are memoized per type.
+    """
+    instance_type = instance.__class__
+    if instance_type in _ITER_TYPES:
+        return True
+    verdict = _ITER_TYPE_CACHE.get(instance_type)
+    if verdict is None:
+        verdict = is_iterable(instance)
+        _ITER_TYPE_CACHE[instance_type] = verdict
+    return verdict
+
+
+class ExpressionNode(BaseGetter):
+    """
+    A single node of a compiled expression chain.
+
+    `ExpressionNode.build` parses a full expression such as
+    `a[0].b[1:2].c?` into a linked list of nodes, one per segment, and
+    returns the root. `get` then walks the chain against an instance,
+    applying each node's `SourceNode` in turn.
+
+    Examples:
+
+        ```python
+        root = ExpressionNode.build("person.name")
+        root.get({'person': {'name': 'Alice'}})  # 'Alice'
+        ```
+
+        ```python
+        root = ExpressionNode.build("a.b?.c")
+        root.get({'a': {}})  # None, `b` is optional
+        ```
+    """
+
+    # Slots instead of a per-instance dict: attribute reads in the hot
+    # walk become fixed-offset loads and each node shrinks accordingly,
+    # which matters when whole schemas of expressions are compiled.
+    __slots__ = (
+        "expression",
+        "default",
+        "parent",
+        "child",
+        "optional",
+        "source",
+        "_chain",
+        "_compiled",
+        "_absorbs",
+    )
+
+    def __init__(self, expression: str, default=None, parent: "ExpressionNode" = None):
+        self.expression = expression
+        self.default = default
+        self.parent = parent
+        self.child = None
+        self.optional = False
+        self.source = SourceNode(expression) if expression else None
+        # Suffix of the chain starting at this node; `_build` replaces it
+        # once the full chain is linked so `get` can iterate instead of
+        # recursing one Python frame per segment.
+        self._chain = (self,)
+        # Monolithic getter generated by `_build` for subscript-only
+        # chains; `None` keeps the interpreted walk.
+        self._compiled = None
+        # Whether a missing value is absorbed rather than raised; folded
+        # into one flag at build time (`_build` refreshes it once the
+        # optional marker is known) so the per-step miss check is a
+        # single attribute load instead of re-deriving it from
+        # `optional` and `default`.
+        self._absorbs = default is not None
+
+    @classmethod
+    def build(cls, expression: str, default=None) -> Union["ExpressionNode", None]:
+        """
+        Parses the full expression into a chain of nodes and returns the
+        root node, or `None` for an empty expression.
+
+        The same small literal expressions are compiled over and over in
+        typical use, so built chains are cached process-wide by
+        `(class, expression, default)` and shared. Built chains are never
+        mutated after `build` returns, which keeps sharing safe; an
+        unhashable default simply skips the cache.
+        """
+        try:
+            key = (cls, expression, default)
+            cached = _BUILD_CACHE.get(key, _MISSING)
+        except TypeError:
+            return cls._build(expression, default)
+        if cached is not _MISSING:
+            return cached
+        root = cls._build(expression, default)
+        if len(_BUILD_CACHE) < _BUILD_CACHE_MAX:
+            _BUILD_CACHE[key] = root
+        return root
+
+    @classmethod
+    def _build(cls, expression: str, default=None) -> Union["ExpressionNode", None]:
+        if not expression:
+            return None
+
+        # Bracket balance is validated up front so the tokenizer below
+        # never has to track nesting state per character.
+        lsb_count = expression.count(Token.LSB)
+        rsb_count = expression.count(Token.RSB)
+        if lsb_count > rsb_count:
+            raise InvalidSourceExpression(
+                f"`{expression}` Syntax error: Unmatched '['."
+            )
+        if rsb_count > lsb_count:
+            raise InvalidSourceExpression(
+                f"`{expression}` Syntax error, Array index must be in "
+                f"the following pattern `item[n]`"
+            )
+
+        # First pass: the C-level regex scanner emits whole segments
+        # (bracketed selectors, `?`/`^` markers, bare names); only dots
+        # may appear between consecutive matches in a well-formed
+        # expression. Markers are folded into the segment they follow.
+        segments = []
+        pos = 0
+        for match in _NODE_TOKEN_RE.finditer(expression):
+            start = match.start()
+            if expression.find(Token.LSB, pos, start) != -1:
+                raise InvalidSourceExpression(
+                    f"`{expression}` Syntax error, `[` inside `[]` not "
+                    f"allowed."
+                )
+            # A `]` the scanner skipped has no opening `[` before it.
+            if expression.find(Token.RSB, pos, start) != -1:
+                raise InvalidSourceExpression(
+                    f"`{expression}` Syntax error, Array index must be in "
+                    f"the following pattern `item[n]`"
+                )
+            token = match.group()
+            if match.lastgroup == "mark":
+                if not segments:
+                    raise InvalidSourceExpression(
+                        f"`{expression}` Syntax error, `{token}` must "
+                        f"follow a segment"
+                    )
+                if token == Token.Q_MARK:
+                    segments[-1][1] = True
+                else:
+                    segments[-1][2] = True
+            else:
+                segments.append([token, False, False])
+            pos = match.end()
+
+        # Brackets left after the final match (e.g. a trailing `[` whose
+        # mate sits misordered earlier) were never consumed as a selector.
+        if (
+            expression.find(Token.LSB, pos) != -1
+            or expression.find(Token.RSB, pos) != -1
+        ):
+            raise InvalidSourceExpression(
+                f"`{expression}` Syntax error, Array index must be in "
+                f"the following pattern `item[n]`"
+            )
+
+        # Second pass: cons the chain from the tail so identical
+        # suffixes (`.id`, `.name`, `[0].title`) are shared across
+        # compiled expressions; nodes are immutable after build, which
+        # makes the sharing safe. Only the dominant `default is None`
+        # case is pooled, so per-default variants stay private.
+        poolable = default is None
+        child = None
+        for token, optional, unique in reversed(segments):
+            key = (cls, token, optional, unique, id(child))
+            node = _NODE_POOL.get(key) if poolable else None
+            if node is None:
+                node = cls(token, default=default)
+                node.optional = optional
+                node._absorbs = optional or default is not None
+                if unique:
+                    node.source.unique_array = True
+                node.child = child
+                if child is None:
+                    node._chain = (node,)
+                else:
+                    node._chain = (node,) + child._chain
+                node._compiled = _compile_chain(node._chain)
+                if poolable and len(_NODE_POOL) < _NODE_POOL_MAX:
+                    _NODE_POOL[key] = node
+            child = node
+        return child
 
-                if operation == OperationType.ARR_SELECT:
-                    instance = [instance[attr]]
+    def validate_value(self, value):
+        """
+        Raises `ValueDoesNotExist` when the value is missing and neither
+        the optional marker nor a default can absorb it.
+
+        Kept as a public helper; `get_node_value` inlines the same check
+        to avoid one Python call per traversal step.
+        """
+        if value is NonExistent and not self._absorbs:
+            raise ValueDoesNotExist(
+                "Value doesn't exist for source `{}` at `{}`",
+                self.expression,
+                self.source.getter,
+            )
+        return value
 
-                instance = [
-                    self.get(each, default, index + 1, root) for each in instance
-                ]
+    def get_node_value(self, instance):
+        """
+        Applies this node's scalar getter to the instance. Returns the
+        `NonExistent` sentinel when the value is missing.
+        """
+        source = self.source
+        getter = source.getter
+        if source.source_op_type == SourceOpType.ARRAY_INDEX_SELECT:
+            if not _is_iterable_fast(instance):
+                raise InvalidDataType(
+                    "Value is not iterable for source `{}`".format(self.expression)
+                )
+            # Out-of-range indices are the expected path on optional
+            # chains; for the dominant list/tuple shapes a bounds check
+            # skips the raise-and-catch machinery. Other subscriptables
+            # keep the exact try/except semantics.
+            instance_type = instance.__class__
+            if instance_type is list or instance_type is tuple:
+                n = len(instance)
+                if -n <= getter < n:
+                    value = instance[getter]
+                else:
+                    value = NonExistent
+            else:
+                try:
+                    value = instance[getter]
+                except IndexError:
+                    value = NonExistent
+        else:
+            # The Mapping check walks the ABC registry, which is far more
+            # than a pointer compare; instance types repeat across a
+            # traversal, so the verdict is memoized per concrete type,
+            # and plain `dict` - virtually all mapping traffic - is
+            # settled with one pointer compare before the cache probe.
+            instance_type = instance.__class__
+            if instance_type is dict:
+                is_mapping = True
+            else:
+                is_mapping = _MAPPING_TYPE_CACHE.get(instance_type)
+                if is_mapping is None:
+                    is_mapping = isinstance(instance, Mapping)
+                    _MAPPING_TYPE_CACHE[instance_type] = is_mapping
+            if is_mapping:
+                value = instance.get(getter, NonExistent)
+            else:
+                value = getattr(instance, getter, NonExistent)
+                # The builtin `callable` is a C slot check; it screens
+                # out plain data attributes before the cache probe pays
+                # for a key tuple and dict hash.
+                if value is not NonExistent and callable(value):
+                    # Whether an attribute is an auto-invocable callable
+                    # is a property of the class, not the instance, so
+                    # the signature inspection inside `is_callable` runs
+                    # once per (type, attribute) pair.
+                    key = (instance_type, getter)
+                    auto_call = _CALL_CACHE.get(key)
+                    if auto_call is None:
+                        auto_call = is_callable(value)
+                        _CALL_CACHE[key] = auto_call
+                    if auto_call:
+                        value = value()
+        # `validate_value`, inlined: one sentinel identity check is not
+        # worth a frame push per step.
+        if value is NonExistent and not self._absorbs:
+            raise ValueDoesNotExist(
+                "Value doesn't exist for source `{}` at `{}`",
+                self.expression,
+                self.source.getter,
+            )
+        return value
 
-                instance = instance[attr] if operation == OperationType.ARR_SELECT else instance
+    def get(self, instance: Any, root_instance=None):
+        """
+        Walks the node chain against the instance and returns the value,
+        the node default for absorbed missing values.
 
-                break
+        Chains compiled down to a single subscript expression run that
+        first; scalar segments otherwise run in a flat loop over the
+        prebuilt `_chain`, and only array fan-outs recurse, one frame
+        per element.
+        """
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled(instance, self._get_interpreted)
+        return self._get_interpreted(instance, root_instance)
 
+    def _get_interpreted(self, instance, root_instance=None):
+        # A sentinel handed down from an absorbed optional chain means
+        # there is nothing left to traverse; answer before paying for a
+        # node step.
+        if instance is Empty or instance is NonExistent:
+            return self.default
+        # Identity test, not truthiness: a legitimate falsy root ({}, 0,
+        # "") must not be mistaken for "no root", and `is None` skips a
+        # __bool__/__len__ call on arbitrary instances.
+        if root_instance is None:
+            root_instance = instance
+        chain = self._chain
+        chain_len = len(chain)
+        non_existent = NonExistent
+        index = 0
+        while index < chain_len:
+            node = chain[index]
+            source = node.source
+            if source is None:
+                return node.default
+            if source.is_array_op:
+                return node.get_array_value(instance, root_instance)
+            value = node.get_node_value(instance)
+            if value is non_existent:
+                return node.default
+            index += 1
+            instance = value
         return instance
 
+    def get_array_value(self, instance, root_instance):
+        """
+        Applies an array-op segment: narrows the instance with the
+        slice or multi-index selector, then fans out over the elements.
+        """
+        source = self.source
+        if not _is_iterable_fast(instance):
+            raise InvalidDataType(
+                "Value is not iterable for source `{}`".format(self.expression)
+            )
+        if source.source_op_type == SourceOpType.ARRAY_SLICE_SELECT:
+            try:
+                instance = instance[source.static_slice]
+            except TypeError:
+                raise InvalidDataType(
+                    "Value doesn't support slicing for source `{}`".format(
+                        self.expression
+                    )
+                )
+        elif source.source_op_type == SourceOpType.ARRAY_MULTI_INDEX_SELECT:
+            instance = list(source.multi_getter(instance))
+
+        # Accumulate into a plain list with bound append/extend and
+        # deduplicate once at the end: per-element EArray inserts (and
+        # the EArray reallocation behind `+=` for list children) made
+        # unique fan-outs quadratic.
+        if self.child is None:
+            buf = list(instance)
+        else:
+            buf = []
+            append = buf.append
+            extend = buf.extend
+            child_get = self.child.get
+            for each_instance in instance:
+                child_val = child_get(each_instance, root_instance)
+                if type(child_val) is list:
+                    extend(child_val)
+                else:
+                    append(child_val)
+        if source.unique_array:
+            return EArray(unique=True).extend_unique(buf).array
+        return buf
+
+
+def _evaluate_group(entries, instance, results):
+    """
+    Resolves a batch of `(position, node)` entries against one instance,
+    grouping scalar object segments by getter so a shared prefix is read
+    once. Missing or exotic prefixes fall back to the node's own `get`
+    so per-root optional/default semantics are untouched.
+    """
+    groups = {}
+    for position, node in entries:
+        source = node.source
+        if (
+            source is None
+            or source.source_op_type != SourceOpType.CHILD_OBJ_SELECT
+            or node.child is None
+        ):
+            results[position] = node.get(instance)
+            continue
+        groups.setdefault(source.getter, []).append((position, node))
+    for group in groups.values():
+        if len(group) == 1:
+            position, node = group[0]
+            results[position] = node.get(instance)
+            continue
+        node = group[0][1]
+        try:
+            value = node.get_node_value(instance)
+        except (ValueDoesNotExist, InvalidDataType):
+            value = NonExistent
+        if value is NonExistent:
+            for position, each in group:
+                results[position] = each.get(instance)
+            continue
+        _evaluate_group(
+            [(position, each.child) for position, each in group], value, results
+        )
+
+
+def evaluate_many(roots, instance):
+    """
+    Evaluates several compiled `ExpressionNode` chains against the same
+    instance in one pass.
+
+    Serializer-style callers evaluate many expressions (`person.name`,
+    `person.age`, ...) per record; walking each root independently reads
+    the shared prefixes once per expression. This batches the walk so a
+    prefix shared by several chains is resolved a single time.
+
+    Args:
+        roots: Built `ExpressionNode` roots, in output order.
+        instance: The object or mapping to evaluate against.
+
+    Returns:
+        list: One value per root, aligned with the input order.
+    """
+    results = [None] * len(roots)
+    _evaluate_group(list(enumerate(roots)), instance, results)
+    return results
+
+
+class E(BaseGetter):
+    """
+    Expression getter combining one or more `ExpressionNode` chains with
+    the `+` (concatenate) and `|` (fallback) operators.
+
+    Examples:
+
+        ```python
+        e = E("name.first")
+        e.get({"name": {"first": "John"}})  # 'John'
+        ```
+
+        ```python
+        e = E("a.b?.c | a.d", default="N/A")
+        ```
+
+        ```python
+        e1 = E("name.first")
+        e1 + E("name.last")
+        e1.get({"name": {"first": "John", "last": "Doe"}})  # 'JohnDoe'
+        ```
+    """
+
+    def __init__(self, expression: str, default=None):
+        self.expression = expression
+        self.default = default
+        self._ops = self.parse(expression)
+        # Most expressions are a single chain with no operators; `get`
+        # then skips the operator loop entirely.
+        self._single = self._ops[0][1] if len(self._ops) == 1 else None
+
+    def parse(self, expression: str):
+        # Flattened `(operator, node)` program: the operator says how a
+        # node's value combines with the running value, so `get` can
+        # decide before evaluating the node.
+        ops = []
+        for pipe_part in expression.split(Token.PIPE):
+            node = ExpressionNode.build(pipe_part.strip(), default=self.default)
+            if node is not None:
+                ops.append((Token.PIPE if ops else None, node))
+        return ops
+
+    def __add__(self, other: "E"):
+        self._ops.append((Token.PLUS, other))
+        self._single = None
+        return self
+
+    def __or__(self, other: "E"):
+        self._ops.append((Token.PIPE, other))
+        self._single = None
+        return self
+
+    def get(self, obj: Any):
+        single = self._single
+        if single is not None:
+            try:
+                value = single.get(obj)
+            except ValueDoesNotExist:
+                value = Empty
+            return self.default if value is Empty else value
+
+        # LOAD_FAST beats LOAD_GLOBAL/LOAD_ATTR inside the loop.
+        empty = Empty
+        pipe = Token.PIPE
+        plus = Token.PLUS
+        value = empty
+        for operator, node in self._ops:
+            if operator == pipe and value is not empty and value is not None:
+                # The running value already stands; don't evaluate the
+                # fallback chain at all.
+                continue
+            try:
+                val = node.get(obj)
+            except ValueDoesNotExist:
+                val = empty
+            if operator == plus:
+                if value is not empty and val is not empty:
+                    value = value + val
+                elif val is not empty:
+                    value = val
+            else:
+                value = val
+        if value is empty:
+            return self.default
+        return value
@@ -1,8 +1,9 @@
+import functools
 import warnings
-from collections import OrderedDict
 from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from typecrate.datatype import Empty, Null
+from typecrate.expression import ExpressionNode
 
 
 class Type:
@@ -19,7 +20,10 @@ def is_list_or_tuple(value: Any) -> bool:
     :param value: Value that needs to be validated
     :return: bool
     """
-    return value and (isinstance(value, list) or isinstance(value, tuple))
+    # Single tuple-of-types isinstance: one C-level dispatch, and always
+    # a real bool (the old `value and ...` form leaked the value itself
+    # back for empty lists).
+    return isinstance(value, (list, tuple))
 
 
 def create_list_if_none(value: Any) -> List:
@@ -48,15 +52,28 @@ NOT_READ_ONLY_REQUIRED = "May not set both `read_only` and `required`"
 NOT_REQUIRED_DEFAULT = "May not set both `required` and `default`"
 
 
-# Adapted from: django-rest-framework/serializers
-def to_choices_dict(choices: Iterable) -> Dict:
+def _freeze_choices(choices: Iterable) -> tuple:
     """
-    Convert choices into key/value dicts.
+    Recursively converts a choices iterable into a hashable tuple form,
+    used as the memoization key for `to_choices_dict`.
+    :param choices: List or choices
+    :return: Tuple mirroring the choices structure
+    """
+    frozen = []
+    for choice in choices:
+        if isinstance(choice, (list, tuple)):
+            key, value = choice
+            if isinstance(value, (list, tuple)):
+                value = _freeze_choices(value)
+            frozen.append((key, value))
+        else:
+            frozen.append(choice)
+    return tuple(frozen)
 
-    to_choices_dict([1]) -> {1: 1}
-    to_choices_dict([(1, '1st'), (2, '2nd')]) -> {1: '1st', 2: '2nd'}
-    to_choices_dict([('Group', ((1, '1st'), 2))]) -> {'Group': {1: '1st', 2: '2'}}
 
+def _build_choices_dict(choices: Iterable) -> Dict:
+    """
+    Recursive walk behind `to_choices_dict`.
     :param choices: List or choices
     :return: Dictionary of choices
     """
@@ -64,7 +81,9 @@ def to_choices_dict(choices: Iterable) -> Dict:
     # choices = [1, 2, 3]
     # choices = [(1, 'First'), (2, 'Second'), (3, 'Third')]
     # choices = [('Category', ((1, 'First'), (2, 'Second'))), (3, 'Third')]
-    ret = OrderedDict()
+    # Plain dict: insertion-ordered since 3.7, with cheaper construction
+    # than OrderedDict.
+    ret = {}
     for choice in choices:
         if not isinstance(choice, (list, tuple)):
             # single choice
@@ -73,13 +92,46 @@ def to_choices_dict(choices: Iterable) -> Dict:
             key, value = choice
             if isinstance(value, (list, tuple)):
                 # grouped choices (category, sub choices)
-                ret[key] = to_choices_dict(value)
+                ret[key] = _build_choices_dict(value)
             else:
                 # paired choice (key, display value)
                 ret[key] = value
     return ret
 
 
+@functools.lru_cache(maxsize=256)
+def _to_choices_dict_cached(frozen: tuple) -> Dict:
+    """
+    Memoized entry over the frozen choices tuple: the same module-level
+    choices are shared across many field declarations, so the recursive
+    walk runs once per distinct definition.
+    :param frozen: Frozen tuple of choices
+    :return: Dictionary of choices
+    """
+    return _build_choices_dict(frozen)
+
+
+# Adapted from: django-rest-framework/serializers
+def to_choices_dict(choices: Iterable) -> Dict:
+    """
+    Convert choices into key/value dicts.
+
+    to_choices_dict([1]) -> {1: 1}
+    to_choices_dict([(1, '1st'), (2, '2nd')]) -> {1: '1st', 2: '2nd'}
+    to_choices_dict([('Group', ((1, '1st'), 2))]) -> {'Group': {1: '1st', 2: '2'}}
+
+    The result is cached per choices definition and must be treated as
+    read-only; unhashable choice values fall back to an uncached walk.
+
+    :param choices: List or choices
+    :return: Dictionary of choices
+    """
+    try:
+        return _to_choices_dict_cached(_freeze_choices(choices))
+    except TypeError:
+        return _build_choices_dict(choices)
+
+
 # Adapted from: django-rest-framework/serializers
 def flatten_choices_dict(choices: Dict) -> Dict:
     """
@@ -91,12 +143,12 @@ def flatten_choices_dict(choices: Dict) -> Dict:
     :param choices: Dictionary of choices
     :return: Flat choice dictionary
     """
-    ret = OrderedDict()
+    ret = {}
     for key, value in choices.items():
         if isinstance(value, dict):
-            # grouped choices (category, sub choices)
-            for sub_key, sub_value in value.items():
-                ret[sub_key] = sub_value
+            # grouped choices (category, sub choices): one C-level
+            # update instead of a Python loop over the items
+            ret.update(value)
         else:
             # choice (key, display value)
             ret[key] = value
@@ -238,11 +290,15 @@ class Field:
         self.required = required
         self.optional = optional
 
-        if is_list_or_tuple(validators):
+        if validators is not None and not is_list_or_tuple(validators):
             raise TypeError("`validators` must be list or tuple")
-        self._validators = create_list_if_none(validators)
+        # Field never mutates the user's list, so an existing list is
+        # kept by reference instead of being copied per construction.
+        self._validators = (
+            validators if type(validators) is list else create_list_if_none(validators)
+        )
 
-        if is_list_or_tuple(choices):
+        if choices is not None and not is_list_or_tuple(choices):
             raise TypeError("`choices` must be list or tuple")
         self.choices = create_list_if_none(choices)
 
@@ -253,12 +309,25 @@ class Field:
 
         self.parent = None
         self.field_name = None
-        self.source_root = None
+        # The source chain is compiled once per field; build results are
+        # shared through the process-wide build cache, so repeated
+        # construction with the same source is a dict hit.
+        self.source_root = ExpressionNode.build(self.source)
 
         if not callable(value_processor):
             raise TypeError("`value_processor` must be a callable/function")
         self.value_processor = value_processor
 
+        # `required`/`nullable` and the user validators are fixed after
+        # construction, so the full validator chain is assembled once
+        # here instead of being concatenated on every `validators`
+        # access.
+        self._all_validators = tuple(
+            self.__get_validators()
+            + self._validators
+            + (self.get_default_validators() or [])
+        )
+
     def __get_validators(self) -> List[Callable]:
         """
         Get validators
@@ -282,18 +351,13 @@ class Field:
     @property
     def validators(self):
         """
-        Validators is a lazily loaded property
-        Initially loads the validators from `__get_validators()`
-        Also checks for validators in `default_validators`
-        `default_validators` is for future classes to validate
-        :return:
+        Full validator chain for the field: the `required`/`nullable`
+        validators, then user validators, then `default_validators`
+        from subclasses. Assembled once in `__init__`; this property
+        only hands out the precomputed tuple.
+        :return: Tuple of validators
         """
-        validators = self.__get_validators()
-        validators += self._validators
-        default_validators = self.get_default_validators()
-        if default_validators:
-            validators += default_validators
-        return validators
+        return self._all_validators
 
     def bind(self, field_name: str, parent: Any):
         self.field_name = field_name
@@ -2,22 +2,33 @@ class ClassProperty(object):
     def __init__(self, f_get, f_set=None):
         self.f_get = f_get
         self.f_set = f_set
+        # The underlying function is unwrapped once here, so `__get__`
+        # can call it directly instead of rebuilding a bound method
+        # through the descriptor protocol on every attribute read.
+        self._raw_get = f_get.__func__ if isinstance(f_get, classmethod) else None
+        self._raw_set = None
 
     def __get__(self, obj, klass=None):
         if klass is None:
             klass = type(obj)
+        if self._raw_get is not None:
+            return self._raw_get(klass)
         return self.f_get.__get__(obj, klass)()
 
     def __set__(self, obj, value):
         if not self.f_set:
             raise AttributeError("can't set attribute")
         type_ = type(obj)
+        if self._raw_set is not None:
+            return self._raw_set(type_, value)
         return self.f_set.__get__(obj, type_)(value)
 
     def setter(self, func):
         if not isinstance(func, (classmethod, staticmethod)):
             func = classmethod(func)
         self.f_set = func
+        if isinstance(func, classmethod):
+            self._raw_set = func.__func__
         return self
 
 
@@ -1,23 +1,47 @@
+from array import array as typed_array
 from typing import Any
 
 
 class EArray:
     """
     Special array to store value
+
+    Unique mode dedupes on the way in: an incremental membership set is
+    maintained alongside the array, so reads never rebuild a `set` over
+    the stored elements and insertion order is preserved.
+
+    A `dtype` (an `array.array` typecode such as `"q"` for 8-byte ints)
+    switches the backing store to a packed numeric array: one machine
+    word per element instead of a pointer to a boxed Python object,
+    which halves memory for large numeric accumulators.
     """
 
-    def __init__(self, unique=False, array=None):
-        if not array:
-            array = []
-        self._array = array
+    def __init__(self, unique=False, array=None, dtype=None):
         self.unique = unique
+        self.dtype = dtype
+        # Membership index for unique mode; `None` until needed.
+        self._seen = None
+        if dtype is not None:
+            self._array = typed_array(dtype)
+            if array:
+                if unique:
+                    self.extend_unique(array)
+                else:
+                    self._array.extend(array)
+        elif unique and array:
+            self._array = []
+            self.extend_unique(array)
+        else:
+            self._array = array if array else []
 
     @property
     def array(self):
-        return list(self._array) if not self.unique else list(set(self._array))
+        # Unique mode already deduped on the way in, so a read is a
+        # plain copy either way.
+        return list(self._array)
 
     def __getitem__(self, index):
-        return self.array[index]
+        return self._array[index]
 
     def __setitem__(self, index, value):
         self._array[index] = value
@@ -26,25 +50,82 @@ class EArray:
         del self._array[index]
 
     def __len__(self):
-        return len(self.array)
+        return len(self._array)
 
     def __add__(self, other):
-        if type(other) is list:
-            new_array = self._array + other
-            return EArray(unique=self.unique, array=new_array)
-        elif type(other) is EArray:
-            return EArray(
-                unique=self.unique or other.unique, array=self.array + other.array
-            )
+        # Concatenate the stored containers directly; the constructor
+        # dedups once over the merged result when either side is unique,
+        # rather than deduping both operands, concatenating, and
+        # deduping again.
+        if type(other) is EArray:
+            items = other._array
+            unique = self.unique or other.unique
+        elif type(other) is list:
+            items = other
+            unique = self.unique
+        else:
+            return NotImplemented
+        if self.dtype is None and type(items) is list:
+            return EArray(unique=unique, array=self._array + items)
+        # Packed operand(s): rebuild through extend so the result keeps
+        # (or gains) this side's backing store.
+        merged = EArray(unique=unique, dtype=self.dtype)
+        if unique:
+            merged.extend_unique(self._array)
+            merged.extend_unique(items)
+        else:
+            merged._array.extend(self._array)
+            merged._array.extend(items)
+        return merged
 
     def __iadd__(self, other):
-        if type(other) is list:
-            new_array = self._array + other
-            return EArray(unique=self.unique, array=new_array)
-        elif type(other) is EArray:
-            return EArray(
-                unique=self.unique or other.unique, array=self.array + other.array
-            )
+        # In-place extend: rebuilding a fresh EArray per `+=` made
+        # accumulation loops quadratic.
+        if type(other) is EArray:
+            self.unique = self.unique or other.unique
+            other = other._array
+        if self.unique:
+            self.extend_unique(other)
+        else:
+            self._array.extend(other)
+        return self
 
     def insert(self, elem: Any):
-        self._array.append(elem)
+        if self.unique:
+            self.extend_unique((elem,))
+        else:
+            self._array.append(elem)
+
+    def extend_unique(self, iterable):
+        """
+        Bulk-appends only unseen elements, preserving insertion order.
+        Membership is a hash-set probe (`id` for unhashable elements)
+        instead of a rescan of the stored array.
+        """
+        seen = self._seen
+        if seen is None:
+            # First use on an array that predates the index (e.g. the
+            # unique flag was merged in later): dedupe what is already
+            # stored while building the index, keeping the backing kind.
+            seen = self._seen = set()
+            stored = self._array
+            deduped = (
+                typed_array(stored.typecode)
+                if stored.__class__ is typed_array
+                else []
+            )
+            keep = deduped.append
+            for elem in self._array:
+                key = elem if elem.__hash__ is not None else id(elem)
+                if key not in seen:
+                    seen.add(key)
+                    keep(elem)
+            self._array = deduped
+        add = seen.add
+        append = self._array.append
+        for elem in iterable:
+            key = elem if elem.__hash__ is not None else id(elem)
+            if key not in seen:
+                add(key)
+                append(elem)
+        return self
@@ -1,54 +1,317 @@
 import math
-import string
+import operator
+import re
 
 
 class MToken:
-    """Defines constants for different types of mathematical tokens."""
+    """
+    Defines constants for different types of mathematical tokens.
+
+    Small ints: the parse loop compares token tags on every step, and an
+    int compare is a single C-level check instead of a string compare.
+    """
 
-    NUMBER = "NUMBER"  # Token type for numeric literals
-    OPERATOR = "OPERATOR"  # Token type for operators
-    FUNCTION = "FUNCTION"  # Token type for function names
-    VARIABLE = "VARIABLE"  # Token type for variables
-    EOF = "EOF"  # Token type for end-of-file marker
+    NUMBER = 0  # Token type for numeric literals
+    OPERATOR = 1  # Token type for operators
+    FUNCTION = 2  # Token type for function names
+    VARIABLE = 3  # Token type for variables
+    EOF = 4  # Token type for end-of-file marker
 
 
 class MOperator:
-    """Defines constants for different types of mathematical operators."""
+    """
+    Defines constants for different types of mathematical operators.
+
+    The numbering groups the precedence levels, so the additive check is
+    `op <= SUBTRACT` and the multiplicative one a single range compare.
+    """
+
+    ADD = 0  # Addition
+    SUBTRACT = 1  # Subtraction
+    MULTIPLY = 2  # Multiplication
+    DIVIDE = 3  # Division
+    MODULO = 4  # Modulo
+    LPAREN = 5  # Left parenthesis
+    RPAREN = 6  # Right parenthesis
+
+
+# Token tag names for error messages, indexed by the MToken int.
+_TOKEN_NAMES = ("NUMBER", "OPERATOR", "FUNCTION", "VARIABLE", "EOF")
+
+# Operator characters to their MOperator tags; one dict probe classifies
+# an operator character in `tokenize`.
+_CHAR_TO_OP = {
+    "+": MOperator.ADD,
+    "-": MOperator.SUBTRACT,
+    "*": MOperator.MULTIPLY,
+    "/": MOperator.DIVIDE,
+    "%": MOperator.MODULO,
+    "(": MOperator.LPAREN,
+    ")": MOperator.RPAREN,
+}
+
+
+# One C-level scan tokenizes the whole expression; the alternatives are
+# number, operator, name, skippable whitespace and - last - any
+# character the grammar doesn't know, which is reported as an error.
+# Number literals deliberately swallow runs like `1.2.3` whole so the
+# numeric conversion rejects them, as the old per-char scanner did.
+_TOKEN_RE = re.compile(
+    r"(\d[\d.]*|\.\d[\d.]*)"
+    r"|([+\-*/%()])"
+    r"|([A-Za-z@{}]+)"
+    r"|([ \t]+)"
+    r"|(.)"
+)
+
+# RPN opcodes emitted by `MathParser.compile`. Small ints, so `_run`
+# dispatches with C-level integer compares per instruction.
+OP_PUSH = 0  # Push a numeric literal
+OP_LOAD = 1  # Push a variable's value
+OP_ADD = 2
+OP_SUB = 3
+OP_MUL = 4
+OP_DIV = 5
+OP_MOD = 6
+OP_NEG = 7  # Negate the top of the stack
+OP_CALL = 8  # Apply a resolved function to the top of the stack
+
+# Math functions safe to evaluate at compile time; a subclass may
+# register impure callables, which must keep running per evaluation.
+_FOLDABLE_FUNCS = frozenset(
+    {math.sqrt, math.sin, math.cos, math.tan, math.log, math.exp}
+)
+
+# Binary opcode to its Python operator, for the folding pass.
+_BIN_OPS = {
+    OP_ADD: operator.add,
+    OP_SUB: operator.sub,
+    OP_MUL: operator.mul,
+    OP_DIV: operator.truediv,
+    OP_MOD: operator.mod,
+}
+
+# Marker for a stack slot whose value is only known at evaluation time.
+_DYN = object()
+
+
+def _fold_constants(code):
+    """
+    Collapses constant subprograms at compile time.
+
+    Runs the program symbolically: any operator or pure function whose
+    operands are all literals is computed here and re-emitted as one
+    `OP_PUSH`. Division/modulo by a literal zero and math domain errors
+    are deliberately not folded, so they still raise when the program is
+    evaluated, exactly as before.
+
+    Args:
+        code (list): `(opcode, argument)` pairs straight from the grammar.
+
+    Returns:
+        tuple: The folded program.
+    """
+    stack = []
+    push = stack.append
+    for op, arg in code:
+        if op == OP_PUSH:
+            push((arg, ((OP_PUSH, arg),)))
+        elif op == OP_LOAD:
+            push((_DYN, ((OP_LOAD, arg),)))
+        elif op == OP_NEG:
+            value, fragment = stack[-1]
+            if value is not _DYN:
+                stack[-1] = (-value, ((OP_PUSH, -value),))
+            else:
+                stack[-1] = (_DYN, fragment + ((OP_NEG, None),))
+        elif op == OP_CALL:
+            value, fragment = stack[-1]
+            result = _DYN
+            if value is not _DYN and arg in _FOLDABLE_FUNCS:
+                try:
+                    result = arg(value)
+                except (ValueError, OverflowError):
+                    result = _DYN  # leave the error for evaluation time
+            if result is not _DYN:
+                stack[-1] = (result, ((OP_PUSH, result),))
+            else:
+                stack[-1] = (_DYN, fragment + ((OP_CALL, arg),))
+        else:  # binary operator
+            right, right_fragment = stack.pop()
+            left, left_fragment = stack[-1]
+            if (
+                left is not _DYN
+                and right is not _DYN
+                and not (right == 0 and (op == OP_DIV or op == OP_MOD))
+            ):
+                result = _BIN_OPS[op](left, right)
+                stack[-1] = (result, ((OP_PUSH, result),))
+            else:
+                stack[-1] = (
+                    _DYN,
+                    left_fragment + right_fragment + ((op, arg),),
+                )
+    folded = []
+    for _, fragment in stack:
+        folded.extend(fragment)
+    return tuple(folded)
+
+
+def _run(code, var_values):
+    """
+    Executes a compiled RPN program against a value stack.
+
+    Args:
+        code (tuple): `(opcode, argument)` pairs in evaluation order.
+        var_values (tuple): Variable values, indexed by the slot numbers
+            that `OP_LOAD` instructions carry.
+
+    Returns:
+        float: The evaluated result.
+
+    Raises:
+        ValueError: On division by zero.
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for op, arg in code:
+        if op == OP_PUSH:
+            push(arg)
+        elif op == OP_LOAD:
+            push(var_values[arg])
+        elif op == OP_ADD:
+            right = pop()
+            stack[-1] += right
+        elif op == OP_SUB:
+            right = pop()
+            stack[-1] -= right
+        elif op == OP_MUL:
+            right = pop()
+            stack[-1] *= right
+        elif op == OP_DIV:
+            right = pop()
+            if right == 0:
+                raise ValueError("Division by zero")
+            stack[-1] /= right
+        elif op == OP_MOD:
+            right = pop()
+            stack[-1] %= right
+        elif op == OP_NEG:
+            stack[-1] = -stack[-1]
+        else:  # OP_CALL
+            stack[-1] = arg(stack[-1])
+    return pop()
+
+
+class CompiledExpr:
+    """
+    Compiled form of a math expression: the RPN program plus the
+    variable names it reads, in slot order.
+
+    `OP_LOAD` instructions carry integer slots, so evaluation indexes a
+    positional tuple instead of hashing a name per reference. Hot
+    callers can pack values once per row order via `var_names` and call
+    `eval`; `eval_dict` does the packing from a dict per call.
+    """
+
+    __slots__ = ("code", "var_names")
+
+    def __init__(self, code, var_names):
+        self.code = code
+        self.var_names = var_names
+
+    def eval(self, var_values=()):
+        """
+        Evaluates the program against positionally packed values.
+
+        Args:
+            var_values (tuple): One value per name in `var_names`.
+
+        Returns:
+            float: The evaluated result.
+        """
+        return _run(self.code, var_values)
+
+    def eval_dict(self, variables):
+        """
+        Evaluates the program, packing the values out of a dict.
+
+        Args:
+            variables (dict): Dictionary containing variable values.
+
+        Returns:
+            float: The evaluated result.
+
+        Raises:
+            ValueError: When a variable the program reads is missing.
+        """
+        try:
+            var_values = tuple(variables[name] for name in self.var_names)
+        except KeyError as exc:
+            raise ValueError(f"Unknown variable: {exc.args[0]}")
+        return _run(self.code, var_values)
+
 
-    ADD = "+"  # Addition
-    SUBTRACT = "-"  # Subtraction
-    MULTIPLY = "*"  # Multiplication
-    DIVIDE = "/"  # Division
-    MODULO = "%"  # Modulo
-    LPAREN = "("  # Left parenthesis
-    RPAREN = ")"  # Right parenthesis
+# Compiled programs shared per (class, expression): evaluating the same
+# formula in a loop with different variables skips tokenizing and
+# parsing entirely after the first call.
+_CODE_CACHE = {}
+_CODE_CACHE_MAX = 1024
+
+
+class ParseState:
+    """
+    Mutable cursor over one expression's token stream.
+
+    Threading this through the grammar methods keeps the parser object
+    itself read-only during a compile, so one `MathParser` (and the
+    process-wide program cache) can be shared across threads without
+    locking.
+
+    Attributes:
+        tokens (list): The token stream being consumed.
+        index (int): Current index into the token stream.
+        var_slots (dict): Variable name -> slot map built during compile.
+    """
+
+    __slots__ = ("tokens", "index", "var_slots")
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.index = 0
+        self.var_slots = {}
 
 
 class MathParser:
     """
     A math parser to evaluate mathematical expressions.
 
+    The parser holds no per-parse state - each compile runs against its
+    own `ParseState` - so a single shared instance is reentrant.
+
     Attributes:
-        tokens (list): A list of tokens parsed from the input.
-        index (int): Current index in the list of tokens.
-        paren_count (int): Count of parentheses to ensure matching.
         functions (dict): Mapping from function names to their implementations.
     """
 
+    # Default map of supported function names to their implementations.
+    # Each instance copies it in `__init__`, so registering a custom
+    # function on one parser never leaks into the others.
+    functions = {
+        "sqrt": math.sqrt,
+        "sin": math.sin,
+        "cos": math.cos,
+        "tan": math.tan,
+        "log": math.log,
+        "exp": math.exp,
+    }
+
     def __init__(self):
-        """Initializes the parser object and supported functions."""
-        self.tokens = []  # List to store tokens
-        self.index = 0  # Index to navigate the list of tokens
-        self.paren_count = 0  # Counter for parentheses
-        # Map of supported function names to their actual implementations
-        self.functions = {
-            "sqrt": math.sqrt,
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "log": math.log,
-            "exp": math.exp,
-        }
+        # A per-instance copy keeps `parser.functions["myfn"] = f`, the
+        # customization the class docstring advertises, scoped to that
+        # parser instead of mutating the shared class table (and with it
+        # the module-level default parser behind `parse()`).
+        self.functions = dict(self.functions)
 
     def tokenize(self, expression):
         """
@@ -57,74 +320,45 @@ class MathParser:
         Args:
             expression (str): The input expression to tokenize.
 
+        Returns:
+            list: The token stream, ending with an EOF token.
+
         Raises:
             ValueError: When an unrecognized character is encountered.
         """
-        self.tokens = []  # Clear the token list
-        self.index = 0  # Reset the index
-        self.paren_count = 0  # Reset the parentheses count
+        tokens = []
 
         if not expression.strip():  # Check for empty input
             raise ValueError("Empty input provided.")
 
-        i = 0
-        while i < len(expression):
-            # If the character is a digit or a decimal point
-            if expression[i].isdigit() or (
-                expression[i] == "."
-                and i + 1 < len(expression)
-                and expression[i + 1].isdigit()
-            ):
-                start = i  # Record the start index of the number
-                while i < len(expression) and (
-                    expression[i].isdigit() or expression[i] == "."
-                ):
-                    i += 1  # Increment index while it is a part of the number
-                num_str = expression[start:i]
+        append = tokens.append
+        functions = self.functions
+        # One compiled-regex sweep replaces the per-character Python
+        # loop; `lastindex` says which alternative matched.
+        for match in _TOKEN_RE.finditer(expression):
+            group = match.lastindex
+            if group == 1:  # Number literal
+                num_str = match.group()
                 num = (
                     float(num_str) if "." in num_str else int(num_str)
                 )  # Parse as float if it contains '.', otherwise as int
-                self.tokens.append((MToken.NUMBER, num))  # Append as a NUMBER token
-            # If the character is an operator
-            elif expression[i] in (
-                MOperator.ADD,
-                MOperator.SUBTRACT,
-                MOperator.MULTIPLY,
-                MOperator.DIVIDE,
-                MOperator.MODULO,
-                MOperator.LPAREN,
-                MOperator.RPAREN,
-            ):
-                self.tokens.append(
-                    (MToken.OPERATOR, expression[i])
-                )  # Append as an OPERATOR token
-                i += 1  # Move to the next character
-            # If the character is an alphabetic character (function/variable)
-            elif expression[i] in string.ascii_letters + "@{}":
-                start = i  # Record the start index of the name
-                while (
-                    i < len(expression)
-                    and expression[i] in string.ascii_letters + "@{}"
-                ):
-                    i += 1  # Increment index while it is a part of the name
-                name = expression[start:i]
-                if name in self.functions:
-                    self.tokens.append(
-                        (MToken.FUNCTION, name)
-                    )  # Append as a FUNCTION token if it is a recognized function name
+                append((MToken.NUMBER, num))
+            elif group == 2:  # Operator character
+                append((MToken.OPERATOR, _CHAR_TO_OP[match.group()]))
+            elif group == 3:  # Function or variable name
+                name = match.group()
+                # A known function name is resolved to its callable
+                # right here, so no later stage looks it up by name.
+                func = functions.get(name)
+                if func is not None:
+                    append((MToken.FUNCTION, func))
                 else:
-                    self.tokens.append(
-                        (MToken.VARIABLE, name)
-                    )  # Otherwise, append as a VARIABLE token
-            # If the character is a space or tab, skip it
-            elif expression[i] in " \t":
-                i += 1
-            else:
-                raise ValueError(
-                    f"Unknown character: {expression[i]}"
-                )  # Raise an error for unrecognized characters
+                    append((MToken.VARIABLE, name))
+            elif group == 5:  # Unrecognized character (4 is whitespace)
+                raise ValueError(f"Unknown character: {match.group()}")
 
-        self.tokens.append((MToken.EOF, None))  # Append an EOF token at the end
+        append((MToken.EOF, None))  # Append an EOF token at the end
+        return tokens
 
     def parse(self, expression, variables=None):
         """
@@ -139,15 +373,48 @@ class MathParser:
         """
         if variables is None:
             variables = {}
-        self.tokenize(expression)  # Tokenize the input expression
-        return self.expr(variables)  # Evaluate and return the result
+        return self.compile(expression).eval_dict(variables)
+
+    def compile(self, expression):
+        """
+        Compiles an expression into a flat postfix (RPN) program.
 
-    def consume(self, expected_type):
+        The recursive-descent grammar below emits opcodes instead of
+        evaluating on the spot, so syntax errors surface at compile time
+        exactly as they used to, while evaluation becomes a single stack
+        loop over the program. Function names are resolved to their
+        callables and variable names to integer slots here, not at run
+        time.
+
+        Args:
+            expression (str): The expression to compile.
+
+        Returns:
+            CompiledExpr: The program and its variable slot order.
+        """
+        # The function table is part of the key: names are resolved to
+        # their callables at tokenize time, so a parser with a custom or
+        # replaced table must not be served a program compiled against a
+        # different one (where its functions parsed as variables).
+        key = (self.__class__, frozenset(self.functions.items()), expression)
+        program = _CODE_CACHE.get(key)
+        if program is None:
+            state = ParseState(self.tokenize(expression))
+            buf = []
+            self.expr(state, buf)  # Emit the program
+            # Insertion order of the slot map is the slot numbering.
+            program = CompiledExpr(_fold_constants(buf), tuple(state.var_slots))
+            if len(_CODE_CACHE) < _CODE_CACHE_MAX:
+                _CODE_CACHE[key] = program
+        return program
+
+    def consume(self, state, expected_type):
         """
         Consumes a token, checking its type.
 
         Args:
-            expected_type (str): The expected token type to consume.
+            state (ParseState): The parse in progress.
+            expected_type (int): The expected token type to consume.
 
         Returns:
             value: The value of the consumed token.
@@ -156,126 +423,126 @@ class MathParser:
             ValueError: When the token type doesn't match the expected type.
         """
         if (
-            self.tokens[self.index][0] == expected_type
+            state.tokens[state.index][0] == expected_type
         ):  # Check if the current token type matches the expected type
-            self.index += 1  # Move to the next token
-            return self.tokens[self.index - 1][
+            state.index += 1  # Move to the next token
+            return state.tokens[state.index - 1][
                 1
             ]  # Return the value of the consumed token
         else:
             raise ValueError(
-                f"Expected {expected_type}, got {self.tokens[self.index][0]}"
+                f"Expected {_TOKEN_NAMES[expected_type]}, "
+                f"got {_TOKEN_NAMES[state.tokens[state.index][0]]}"
             )  # Raise an error if types don't match
 
-    def expr(self, variables):
+    def expr(self, state, code):
         """
-        Evaluates addition and subtraction expressions.
+        Compiles addition and subtraction expressions.
 
         Args:
-            variables (dict): Dictionary containing variable values.
-
-        Returns:
-            float: The evaluated result.
+            state (ParseState): The parse in progress.
+            code (list): Opcode buffer being emitted into.
         """
-        result = self.term(variables)  # Start by evaluating the first term
-        # Loop as long as we see addition or subtraction operators
-        while self.tokens[self.index][0] == MToken.OPERATOR and self.tokens[self.index][
-            1
-        ] in (MOperator.ADD, MOperator.SUBTRACT):
-            op = self.consume(MToken.OPERATOR)  # Consume the operator
-            if op == MOperator.ADD:
-                result += self.term(variables)  # Add the next term
-            else:
-                result -= self.term(variables)  # Subtract the next term
-        return result
-
-    def term(self, variables):
+        self.term(state, code)  # Start by compiling the first term
+        # Loop as long as we see addition or subtraction operators; the
+        # current token is re-read into a local once per iteration
+        # instead of double-subscripting state.tokens[state.index] per
+        # condition leg.
+        tokens = state.tokens
+        tok = tokens[state.index]
+        while tok[0] == MToken.OPERATOR and tok[1] <= MOperator.SUBTRACT:
+            op = self.consume(state, MToken.OPERATOR)  # Consume the operator
+            self.term(state, code)  # Compile the next term
+            code.append((OP_ADD if op == MOperator.ADD else OP_SUB, None))
+            tok = tokens[state.index]
+
+    def term(self, state, code):
         """
-        Evaluates multiplication, division, and modulo expressions.
+        Compiles multiplication, division, and modulo expressions.
 
         Args:
-            variables (dict): Dictionary containing variable values.
-
-        Returns:
-            float: The evaluated result.
+            state (ParseState): The parse in progress.
+            code (list): Opcode buffer being emitted into.
         """
-        result = self.factor(variables)  # Start by evaluating the first factor
+        self.factor(state, code)  # Start by compiling the first factor
         # Loop as long as we see multiplication, division, or modulo operators
-        while self.tokens[self.index][0] == MToken.OPERATOR and self.tokens[self.index][
-            1
-        ] in (MOperator.MULTIPLY, MOperator.DIVIDE, MOperator.MODULO):
-            op = self.consume(MToken.OPERATOR)  # Consume the operator
+        tokens = state.tokens
+        tok = tokens[state.index]
+        while tok[0] == MToken.OPERATOR and MOperator.MULTIPLY <= tok[1] <= MOperator.MODULO:
+            op = self.consume(state, MToken.OPERATOR)  # Consume the operator
+            self.factor(state, code)  # Compile the next factor
             if op == MOperator.MULTIPLY:
-                result *= self.factor(variables)  # Multiply by the next factor
+                code.append((OP_MUL, None))
             elif op == MOperator.DIVIDE:
-                divisor = self.factor(variables)  # Divide by the next factor
-                if divisor == 0:
-                    raise ValueError("Division by zero")
-                result /= divisor
+                code.append((OP_DIV, None))
             else:
-                result %= self.factor(variables)  # Take modulo by the next factor
-        return result
+                code.append((OP_MOD, None))
+            tok = tokens[state.index]
 
-    def factor(self, variables):
+    def factor(self, state, code):
         """
-        Evaluates numbers, functions, and expressions inside parentheses.
+        Compiles numbers, variables, functions, and expressions inside
+        parentheses.
 
         Args:
-            variables (dict): Dictionary containing variable values.
-
-        Returns:
-            float: The evaluated result.
+            state (ParseState): The parse in progress.
+            code (list): Opcode buffer being emitted into.
         """
-        if self.tokens[self.index][0] == MToken.FUNCTION:  # If the token is a function
-            func_name = self.consume(MToken.FUNCTION)  # Consume the function name
-            self.consume(MToken.OPERATOR)  # Assume a '(' follows the function name
-            arg = self.expr(variables)  # Evaluate the expression within the function
-            self.consume(MToken.OPERATOR)  # Consume ')'
-            return self.functions[func_name](
-                arg
-            )  # Call the function with the evaluated argument
-        elif self.tokens[self.index][0] == MToken.OPERATOR and self.tokens[self.index][
-            1
-        ] in (
-            MOperator.ADD,
-            MOperator.SUBTRACT,
-        ):  # If the token is a unary plus or minus
-            op = self.consume(MToken.OPERATOR)  # Consume the operator
-            num = self.factor(variables)  # Evaluate the factor after the unary operator
-            return (
-                num if op == MOperator.ADD else -num
-            )  # Return the value, negated if necessary
-        elif self.tokens[self.index][0] == MToken.NUMBER:  # If the token is a number
-            return self.consume(MToken.NUMBER)  # Consume and return the number
+        # Every branch dispatches on the same current token, so it is
+        # read into a local once.
+        tok = state.tokens[state.index]
+        tag = tok[0]
+        if tag == MToken.FUNCTION:  # If the token is a function
+            func = self.consume(state, MToken.FUNCTION)  # Token carries the callable
+            self.consume(state, MToken.OPERATOR)  # Assume a '(' follows the name
+            self.expr(state, code)  # Compile the expression within the function
+            self.consume(state, MToken.OPERATOR)  # Consume ')'
+            code.append((OP_CALL, func))
         elif (
-            self.tokens[self.index][0] == MToken.VARIABLE
-        ):  # If the token is a variable
-            var_name = self.consume(MToken.VARIABLE)  # Consume the variable name
-            if var_name in variables:
-                return variables[
-                    var_name
-                ]  # Return the value of the variable from the dictionary
-            else:
-                raise ValueError(
-                    f"Unknown variable: {var_name}"
-                )  # Raise an error for unknown variables
+            tag == MToken.OPERATOR and tok[1] <= MOperator.SUBTRACT
+        ):  # If the token is a unary plus or minus
+            op = self.consume(state, MToken.OPERATOR)  # Consume the operator
+            self.factor(state, code)  # Compile the factor after the unary operator
+            if op == MOperator.SUBTRACT:
+                code.append((OP_NEG, None))
+        elif tag == MToken.NUMBER:  # If the token is a number
+            code.append((OP_PUSH, self.consume(state, MToken.NUMBER)))
+        elif tag == MToken.VARIABLE:  # If the token is a variable
+            # Assign the name a fixed slot; the program loads by index
+            name = self.consume(state, MToken.VARIABLE)
+            slots = state.var_slots
+            code.append((OP_LOAD, slots.setdefault(name, len(slots))))
         elif (
-            self.tokens[self.index][0] == MToken.OPERATOR
-            and self.tokens[self.index][1] == MOperator.LPAREN
+            tag == MToken.OPERATOR and tok[1] == MOperator.LPAREN
         ):  # If the token is a '('
-            self.consume(MToken.OPERATOR)  # Consume '('
-            result = self.expr(
-                variables
-            )  # Evaluate the expression within the parentheses
-            self.consume(MToken.OPERATOR)  # Consume ')'
-            return result  # Return the evaluated result
+            self.consume(state, MToken.OPERATOR)  # Consume '('
+            self.expr(state, code)  # Compile the expression within the parentheses
+            self.consume(state, MToken.OPERATOR)  # Consume ')'
         else:
             raise ValueError(
-                f"Unexpected token: {self.tokens[self.index][0]}"
+                f"Unexpected token: {_TOKEN_NAMES[tag]}"
             )  # Raise an error for any other token
 
 
+# Shared default parser; `parse` delegates to it so repeat callers don't
+# pay parser construction per expression.
+_DEFAULT_PARSER = MathParser()
+
+
+def parse(expression, variables=None):
+    """
+    Parses and evaluates an expression with the shared default parser.
+
+    Args:
+        expression (str): The expression to parse.
+        variables (dict): Dictionary containing variable values.
+
+    Returns:
+        float: The evaluated result.
+    """
+    return _DEFAULT_PARSER.parse(expression, variables)
+
+
 if __name__ == "__main__":
-    parser = MathParser()
     v = {"@x": 5, "@y": 10}
-    print(parser.parse("sqrt(@y) + sin(@x)", v))  # Example usage with variables
+    print(parse("sqrt(@y) + sin(@x)", v))  # Example usage with variables
@@ -1,12 +1,39 @@
 import functools
 import inspect
-from typing import Iterable, Mapping
+from typing import Mapping
 
 from typecrate.exceptions import BuiltinFunctionsError, ValueDoesNotExist
 
 
 def is_iterable(obj):
-    return isinstance(obj, Iterable)
+    # One slot lookup on the type; the Iterable ABC check it replaces
+    # walks the registry and __subclasshook__ on uncached types. Probing
+    # the class rather than the instance also keeps __getattr__ hooks
+    # out of the verdict. Strings stay iterable, as before.
+    return getattr(obj.__class__, "__iter__", None) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _signature_allows_auto_call(func, skip_first):
+    """
+    True if every (remaining) parameter of the callable is optional.
+
+    `inspect.signature` rebuilds a Signature object on every call and is
+    by far the most expensive step of `is_callable`; the verdict only
+    depends on the underlying function, so it is memoized here. Bound
+    methods are probed through `__func__` with `skip_first=True` so all
+    instances of a class share one cache entry.
+    """
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+    if skip_first:
+        params = params[1:]
+    return all(
+        param.kind == param.VAR_POSITIONAL or
+        param.kind == param.VAR_KEYWORD or
+        param.default != param.empty
+        for param in params
+    )
 
 
 # From: django-rest-framework/fields
@@ -21,21 +48,17 @@ def is_callable(obj):
     if inspect.isbuiltin(obj):
         raise BuiltinFunctionsError("Built-in functions are not usable. ")
 
-    if not (
-            inspect.isfunction(obj)
-            or inspect.ismethod(obj)
-            or isinstance(obj, functools.partial)
-    ):
-        return False
-
-    sig = inspect.signature(obj)
-    params = sig.parameters.values()
-    return all(
-        param.kind == param.VAR_POSITIONAL or
-        param.kind == param.VAR_KEYWORD or
-        param.default != param.empty
-        for param in params
-    )
+    if inspect.ismethod(obj):
+        # Key the cache on the function, not the per-access bound
+        # method object (a fresh one is created on every attribute
+        # read, which would defeat the cache).
+        return _signature_allows_auto_call(obj.__func__, True)
+    if inspect.isfunction(obj) or isinstance(obj, functools.partial):
+        # Partials are keyed by identity: their signature depends on
+        # the bound arguments, and they are typically created once and
+        # stored.
+        return _signature_allows_auto_call(obj, False)
+    return False
 
 
 def get_attribute(instance, attr):
@@ -44,16 +67,18 @@ def get_attribute(instance, attr):
     """
     try:
         if isinstance(instance, Mapping):
-            instance = instance[attr]
-        else:
-            instance = getattr(instance, attr)
+            # A value fetched out of a mapping is data, not a method to
+            # auto-invoke; returning it directly skips the reflective
+            # callable probe entirely.
+            return instance[attr]
+        instance = getattr(instance, attr)
     except (KeyError, AttributeError):
         raise ValueDoesNotExist(
-            "Value doesn't exist for key `{}`".format(
-                attr
-            )
+            "Value doesn't exist for key `{}`", attr
         )
-    if is_callable(instance):
+    # `callable` is a cheap C slot check that screens out the plain data
+    # attributes before `is_callable` does any signature work.
+    if callable(instance) and is_callable(instance):
         try:
             instance = instance()
         except (AttributeError, KeyError) as exc: